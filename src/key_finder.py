@@ -1,8 +1,15 @@
-import bitcoin  # For conversions between private and public keys
-import bitcoinlib  # For Bitcoin operations
-from ecdsa import SECP256k1, numbertheory  # For elliptic curve operations
-from ecdsa.ellipticcurve import Point  # To represent points on the curve
+from coincurve import PublicKey  # libsecp256k1 bindings for fast point arithmetic
+from coincurve._libsecp256k1 import ffi, lib  # Raw libsecp256k1 calls for the step loops
+from coincurve.context import GLOBAL_CONTEXT
+from coincurve.flags import EC_COMPRESSED
+from ecdsa import SECP256k1  # For elliptic curve operations
+import functools
 import math  # For mathematical operations
+import multiprocessing  # To search bsgs windows on every core
+import numpy as np  # For the compact baby-step table
+import os
+import random  # For kangaroo starting positions
+import threading  # For the progress printer
 import time
 
 
@@ -11,7 +18,8 @@ class KeyFinder:
     KeyFinder class to find the private key corresponding to a Bitcoin public address.
 
     This class implements the Baby-step Giant-step algorithm to efficiently search for the private key
-    within a specified range. It provides methods to generate public addresses and WIF (Wallet Import Format)
+    within a specified range, and Pollard's kangaroo algorithm for ranges too large for a baby-step
+    table. It provides methods to generate public addresses and WIF (Wallet Import Format)
     from private keys, as well as to calculate public key points on the elliptic curve.
 
     Methods:
@@ -19,15 +27,24 @@ class KeyFinder:
         generate_wif(private_key): Converts a private key to Wallet Import Format (WIF).
         find_private_key(min_range, max_range, target_address): Searches for the private key that corresponds to the target address.
         find_public_key(private_key): Finds the public key corresponding to a given private key.
-        calculate_public_key_point(target_public_key): Calculates the (x, y) point of the public key on the elliptic curve.
-        bsgs(target_point, max_steps, start): Implements the Baby-step Giant-step algorithm to find the private key.
-        solve_puzzle(target_public_key, target_address, start_range_hex, end_range_hex): Main method to solve the puzzle and find the private key.
+        calculate_public_key_point(target_public_key): Calculates the public key point on the elliptic curve, as a coincurve.PublicKey.
+        bsgs(target_point, max_steps, start, start_point=None, stop=None): Implements the Baby-step Giant-step algorithm to find the private key.
+        kangaroo(target_point, range_start, range_end): Implements Pollard's kangaroo algorithm to find the private key.
+        solve_puzzle(target_public_key, target_address, start_range_hex, end_range_hex, method='bsgs'): Main method to solve the puzzle and find the private key.
     """
 
+    _SQRT_EXP = (SECP256k1.curve.p() + 1) >> 2  # p = 3 (mod 4), so sqrt(a) = a**((p + 1) / 4) mod p
+    _WALK_BLOCK = 4096  # Points serialized per block by _walk
+    _KANGAROO_HERD = 8  # Tame kangaroos per worker process, and as many wild ones
+    _KANGAROO_ROUND = 16  # Distinguished-point spacings each kangaroo jumps per round
+    _CACHE_TABLES = 4  # Baby-step tables kept in a cache_dir; the least recently used are removed
+    _CACHE_SAMPLES = 16  # Entries of a cached baby-step table checked against i*G when it is loaded
+
     @staticmethod
     def find_private_key(min_range, max_range, target_address):
         """Searches for the private key that corresponds to the target address."""
         start_time = time.time()
+        last_print = time.monotonic()
         keys_checked = 0
 
         for private_key in range(min_range, max_range + 1):
@@ -36,9 +53,11 @@ class KeyFinder:
 
             keys_checked += 1
 
-            if keys_checked % 1000 == 0:
+            # Reports progress at most once per second rather than every 1000 keys
+            if time.monotonic() - last_print >= 1.0:
                 elapsed_time = time.time() - start_time
                 print(f"Keys checked: {keys_checked}, Elapsed time: {elapsed_time:.2f} seconds")
+                last_print = time.monotonic()
 
             # Checks if the generated public address matches the target address
             if public_address == target_address:
@@ -49,6 +68,8 @@ class KeyFinder:
     @staticmethod
     def find_public_key(private_key):
         """Finds the public key corresponding to a given private key."""
+        import bitcoin  # For conversions between private and public keys (imported here, off the search path)
+
         private_key_decimal = int(private_key, 16)  # Converts the private key from hexadecimal to decimal
         public_key = bitcoin.privkey_to_pubkey(private_key_decimal)  # Generates the public key
         return public_key
@@ -56,76 +77,398 @@ class KeyFinder:
     @staticmethod
     def generate_wif(private_key):
         """Converts a private key to Wallet Import Format (WIF)."""
+        import bitcoinlib  # For Bitcoin operations (slow to import, only needed once a key is found)
+
         key = bitcoinlib.keys.Key(private_key)
         return key.wif()
 
-    def __init__(self):
+    def __init__(self, cache_dir=None):
+        # Directory baby-step tables are saved to and memory-mapped from; None keeps them in memory only
+        self.cache_dir = cache_dir
         # Elliptic curve SECP256k1 and its generator
         self.curve = SECP256k1.curve
-        self.G = SECP256k1.generator
+        self.G = PublicKey.from_secret((1).to_bytes(32, 'big'))
+        # Baby-step tables of i*G for i in 1..max_steps, built once per max_steps and reused by every window
+        self.baby_step_tables = {}
+        # Negated half windows and giant steps -(max_steps*G), -((2*max_steps + 1)*G), cached per max_steps
+        self.neg_giant_steps = {}
+        # Kangaroo jumps 2**i * G, extended as more are needed
+        self.kangaroo_jumps = []
 
-    def calculate_public_key_point(self, target_public_key):
-        """Calculates the (x, y) point of the public key on the elliptic curve."""
-        public_key_x = int(target_public_key[2:], 16)  # Extracts the x coordinate from the public key
+    @staticmethod
+    @functools.lru_cache  # Keyed on the hex string alone, so every KeyFinder in a process shares it
+    def calculate_public_key_point(target_public_key):
+        """Calculates the public key point on the elliptic curve, returned as a coincurve.PublicKey."""
+        curve = SECP256k1.curve
+        prefix = target_public_key[:2]
+        # Extracts the x coordinate from the public key
+        public_key_x = int.from_bytes(bytes.fromhex(target_public_key[2:]), 'big')
         # Calculates y^2 using the elliptic curve equation
-        y_square = (public_key_x ** 3 + self.curve.a() * public_key_x + self.curve.b()) % self.curve.p()
-        public_key_y = numbertheory.square_root_mod_prime(y_square, self.curve.p())  # Calculates the square root
+        y_square = (public_key_x ** 3 + curve.a() * public_key_x + curve.b()) % curve.p()
+        public_key_y = pow(y_square, KeyFinder._SQRT_EXP, curve.p())  # Calculates the square root
 
         # Adjusts y depending on the prefix of the public key
-        if (target_public_key.startswith('02') and public_key_y % 2 != 0) or (
-                target_public_key.startswith('03') and public_key_y % 2 == 0):
-            public_key_y = self.curve.p() - public_key_y  # Adjusts y to the correct value
+        if (prefix == '02' and public_key_y % 2 != 0) or (prefix == '03' and public_key_y % 2 == 0):
+            public_key_y = curve.p() - public_key_y  # Adjusts y to the correct value
 
-        # Returns the (x, y) point on the curve
-        return Point(self.curve, public_key_x, public_key_y, SECP256k1.order)
+        # Returns the (x, y) point on the curve as a libsecp256k1 public key
+        return PublicKey.from_point(public_key_x, public_key_y)
 
-    def bsgs(self, target_point, max_steps, start):
-        """Implements the Baby-step Giant-step algorithm to find the private key."""
-        baby_steps = {}  # Dictionary to store baby steps
-        giant_step = self.G * max_steps  # Calculates the giant step
-        steps_tried = 0  # Counter for tried steps
+    @staticmethod
+    def _walk(point, step, count):
+        """Yields the top 64 bits of the x coordinates of point + k*step for k in 0..count-1, in blocks."""
+        # libsecp256k1 adds in Jacobian coordinates internally; the running point lives in two
+        # preallocated buffers that are written alternately, so no Python point objects are created
+        buffers = (ffi.new('secp256k1_pubkey *'), ffi.new('secp256k1_pubkey *'))
+        ffi.memmove(buffers[0], point.public_key, ffi.sizeof('secp256k1_pubkey'))
+        addends = [ffi.new('secp256k1_pubkey *[2]', [buffer, step.public_key]) for buffer in buffers]
+        # A block of points is serialized back to back into one buffer. The keys are read straight
+        # out of those 33-byte compressed encodings: a strided big-endian view that skips the sign
+        # byte and covers the first 8 bytes of x.
+        block = ffi.new('unsigned char [%d]' % (33 * KeyFinder._WALK_BLOCK))
+        x_hi_view = np.ndarray((KeyFinder._WALK_BLOCK,), dtype='>u8', buffer=ffi.buffer(block), offset=1, strides=(33,))
+        serialized_len = ffi.new('size_t *', 33)
+        combine = lib.secp256k1_ec_pubkey_combine
+        serialize = lib.secp256k1_ec_pubkey_serialize
+        ctx = GLOBAL_CONTEXT.ctx
+
+        k = 0
+        while k < count:
+            block_size = min(KeyFinder._WALK_BLOCK, count - k)
+            for offset in range(block_size):
+                current = k & 1
+                serialize(ctx, block + 33 * offset, serialized_len, buffers[current], EC_COMPRESSED)
+                k += 1
+                if not combine(ctx, buffers[current ^ 1], addends[current], 2):
+                    # The next sum is the point at infinity, which has no encoding
+                    block_size, count = offset + 1, k
+                    break
+            yield x_hi_view[:block_size].astype(np.uint64)
+
+    @staticmethod
+    def _offset_point(target_point, start):
+        """Returns target_point - start*G, or None if that is the point at infinity."""
+        if start % SECP256k1.order == 0:
+            return target_point  # start*G is the point at infinity, which from_secret can't represent
+        try:
+            return PublicKey.combine_keys(
+                [target_point, PublicKey.from_secret((SECP256k1.order - start).to_bytes(32, 'big'))])
+        except ValueError:
+            return None
+
+    def _baby_steps(self, max_steps):
+        """Returns the baby-step table for max_steps and the number of steps spent building it."""
+        # The table of multiples of G does not depend on start, so it is only built once.
+        # It holds the top 64 bits of each x coordinate (shared by P and -P) sorted for binary search,
+        # with the matching i in a parallel array: about 12 bytes per entry instead of a dict's ~100.
+        baby_steps = self.baby_step_tables.get(max_steps)
+        if baby_steps is not None:
+            return baby_steps, 0
+
+        if self.cache_dir is not None:
+            baby_steps = self._load_baby_steps(max_steps)
+            if baby_steps is not None:
+                self.baby_step_tables[max_steps] = baby_steps
+                return baby_steps, 0
+
+        x_hi = np.concatenate(list(self._walk(self.G, self.G, max_steps)))
+        order = np.argsort(x_hi)
+        baby_steps = x_hi[order], (order + 1).astype(np.min_scalar_type(max_steps))
+        self.baby_step_tables[max_steps] = baby_steps
+
+        if self.cache_dir is not None:
+            self._save_baby_steps(max_steps, baby_steps)
+
+        return baby_steps, max_steps
+
+    def _baby_step_paths(self, max_steps):
+        """Returns the cache_dir paths of the x and index arrays of the baby-step table for max_steps."""
+        return [os.path.join(self.cache_dir, f'baby_steps_{max_steps}_{name}.npy') for name in ('x', 'i')]
 
+    def _load_baby_steps(self, max_steps):
+        """Memory-maps the cached baby-step table for max_steps, or returns None if it is missing or corrupt."""
+        # Memory-mapped, so worker processes share its pages
+        paths = self._baby_step_paths(max_steps)
+        try:
+            x_hi, indices = (np.load(path, mmap_mode='r') for path in paths)
+        except (OSError, ValueError):
+            return None  # Not cached yet (or unreadable), so it is rebuilt
+
+        if x_hi.shape != (max_steps,) or indices.shape != (max_steps,) or x_hi.dtype != np.uint64:
+            return None
+        # A truncated or zeroed file still has the right length, so spot-check entries against i*G:
+        # both ends plus random positions, with each position also compared to its successor for order
+        positions = {0, max_steps - 1} | {random.randrange(max_steps) for _ in range(self._CACHE_SAMPLES)}
+        for position in positions:
+            i = int(indices[position])
+            if not 0 < i <= max_steps:
+                return None
+            encoding = PublicKey.from_secret(i.to_bytes(32, 'big')).format()
+            if int(x_hi[position]) != int.from_bytes(encoding[1:9], 'big'):
+                return None
+            if position + 1 < max_steps and x_hi[position] > x_hi[position + 1]:
+                return None
+
+        for path in paths:
+            try:
+                os.utime(path)  # Marks the table as recently used for _save_baby_steps' pruning
+            except OSError:
+                pass
+        return x_hi, indices
+
+    def _save_baby_steps(self, max_steps, baby_steps):
+        """Saves a baby-step table to cache_dir, keeping only the _CACHE_TABLES most recently used."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for path, array in zip(self._baby_step_paths(max_steps), baby_steps):
+                # Written under a temporary name and renamed, so other processes never load a partial file
+                temporary_path = f'{path}.{os.getpid()}.tmp'
+                with open(temporary_path, 'wb') as file:
+                    np.save(file, array)
+                os.replace(temporary_path, path)
+
+            cached = [
+                name for name in os.listdir(self.cache_dir)
+                if name.startswith('baby_steps_') and name.endswith('_x.npy')
+            ]
+            cached.sort(key=lambda name: os.path.getmtime(os.path.join(self.cache_dir, name)), reverse=True)
+            for name in cached[self._CACHE_TABLES:]:
+                for path in (name, name[:-len('x.npy')] + 'i.npy'):
+                    os.remove(os.path.join(self.cache_dir, path))
+        except OSError:
+            pass  # The cache is only an optimization
+
+    @staticmethod
+    def _is_private_key(private_key, target_encoding):
+        """Checks whether private_key*G has the given compressed encoding."""
+        return 0 < private_key < SECP256k1.order and (
+            PublicKey.from_secret(private_key.to_bytes(32, 'big')).format() == target_encoding)
+
+    def bsgs(self, target_point, max_steps, start, start_point=None, stop=None):
+        """Implements the Baby-step Giant-step algorithm to find the private key."""
+        # The table matches +-i*G for i in 1..max_steps, so a giant step centred on c covers
+        # c - max_steps..c + max_steps and the stride is 2*max_steps + 1: the window is
+        # start..start + max_steps*giant_stride - 1, with giant step j centred on start + max_steps + j*giant_stride
+        giant_stride = 2 * max_steps + 1
+        # Negated half window and giant step, so the giant-step loop only needs point additions
+        neg_steps = self.neg_giant_steps.get(max_steps)
+        if neg_steps is None:
+            neg_steps = tuple(PublicKey.from_secret((SECP256k1.order - step).to_bytes(32, 'big'))
+                              for step in (max_steps, giant_stride))
+            self.neg_giant_steps[max_steps] = neg_steps
+        neg_half_window, neg_giant_step = neg_steps
         # Baby-step
-        current = self.G * start
-        for i in range(max_steps):
-            baby_steps[(current.x(), current.y())] = i
-            current = current + self.G  # Baby step
-            steps_tried += 1
-
-        # Giant-step
-        current = target_point
-        for j in range(max_steps):
-            current_key = (current.x(), current.y())
-            if current_key in baby_steps:
-                return start + j * max_steps + baby_steps[current_key], steps_tried
-            current = current + (-giant_step)  # Giant step (moving backwards)
-            steps_tried += 1
+        (baby_x_hi, baby_indices), steps_tried = self._baby_steps(max_steps)
+
+        # Giant-step (moving backwards from target - start*G, unless the caller already has it)
+        target_encoding = target_point.format()
+        if start_point is None:
+            start_point = self._offset_point(target_point, start)
+            if start_point is None:
+                # target - start*G is the point at infinity, so start is the key if it is a valid one
+                return (start if self._is_private_key(start, target_encoding) else None), steps_tried
+        first_center = start + max_steps
+        j_block = 0  # Giant-step index of the first point in the block
+        try:
+            center_point = PublicKey.combine_keys([start_point, neg_half_window])
+        except ValueError:
+            center_point = None  # The first centre is the key; checked below
+        for x_hi in (self._walk(center_point, neg_giant_step, max_steps) if center_point is not None else ()):
+            # One vectorized binary search for the whole block of giant steps
+            positions = np.searchsorted(baby_x_hi, x_hi)
+            hits = np.flatnonzero(baby_x_hi[np.minimum(positions, max_steps - 1)] == x_hi)
+            for offset in hits.tolist():
+                center = first_center + (j_block + offset) * giant_stride
+                position = int(positions[offset])
+                # Matching top bits mean the point is +-i*G (or, very rarely, a false positive);
+                # the candidate keys are checked against the target
+                while position < max_steps and baby_x_hi[position] == x_hi[offset]:
+                    i = int(baby_indices[position])
+                    for private_key in (center + i, center - i):
+                        if self._is_private_key(private_key, target_encoding):
+                            return private_key, steps_tried + offset
+                    position += 1
+            j_block += len(x_hi)
+            steps_tried += len(x_hi)
+            if stop is not None and stop():
+                # Checked once per block, so a stop request ends the window within _WALK_BLOCK steps
+                return None, steps_tried
+
+        if j_block < max_steps:
+            # The walk ended early at the point at infinity, so the centre of giant step j_block is the key
+            private_key = first_center + j_block * giant_stride
+            if self._is_private_key(private_key, target_encoding):
+                return private_key, steps_tried
 
         return None, steps_tried
 
-    def solve_puzzle(self, target_public_key, target_address, start_range_hex, end_range_hex):
-        """Main method to solve the puzzle and find the private key."""
-        start_range = int(start_range_hex, 16)  # Converts the start range from hexadecimal to decimal
-        end_range = int(end_range_hex, 16)  # Converts the end range from hexadecimal to decimal
+    def _kangaroo_hops(self, target_point, kangaroos, jump_count, dp_bits, hops):
+        """Advances (is_wild, distance) kangaroos by hops jumps each, collecting distinguished points."""
+        while len(self.kangaroo_jumps) < jump_count:
+            self.kangaroo_jumps.append(PublicKey.from_secret((1 << len(self.kangaroo_jumps)).to_bytes(32, 'big')))
+        # Same preallocated-buffer stepping as _walk, with one addend pair per possible jump
+        buffers = (ffi.new('secp256k1_pubkey *'), ffi.new('secp256k1_pubkey *'))
+        addends = [
+            [ffi.new('secp256k1_pubkey *[2]', [buffer, jump.public_key]) for jump in self.kangaroo_jumps[:jump_count]]
+            for buffer in buffers
+        ]
+        serialized = ffi.new('unsigned char [33]')
+        serialized_len = ffi.new('size_t *', 33)
+        serialized_bytes = ffi.buffer(serialized)
+        combine = lib.secp256k1_ec_pubkey_combine
+        serialize = lib.secp256k1_ec_pubkey_serialize
+        ctx = GLOBAL_CONTEXT.ctx
+        dp_mask = (1 << dp_bits) - 1
 
-        interval_size = end_range - start_range + 1
-        max_steps = 2 ** int(math.log2(math.sqrt(interval_size)))
+        advanced = []
+        distinguished = []  # (x coordinate, kangaroo index, is_wild, distance)
+        for index, (is_wild, distance) in enumerate(kangaroos):
+            # A tame kangaroo sits at distance*G, a wild one at target + distance*G
+            point = PublicKey.from_secret(distance.to_bytes(32, 'big'))
+            if is_wild:
+                point = PublicKey.combine_keys([target_point, point])
+            ffi.memmove(buffers[0], point.public_key, ffi.sizeof('secp256k1_pubkey'))
 
-        target_public_key_point = self.calculate_public_key_point(target_public_key)
+            for k in range(hops):
+                current = k & 1
+                serialize(ctx, serialized, serialized_len, buffers[current], EC_COMPRESSED)
+                x = int.from_bytes(serialized_bytes[1:], 'big')
+                if x & dp_mask == 0:
+                    distinguished.append((serialized_bytes[1:], index, is_wild, distance))
+                # The jump only depends on the point, so kangaroos that land on the same point stay together
+                jump = (x >> dp_bits) % jump_count
+                if not combine(ctx, buffers[current ^ 1], addends[current][jump], 2):
+                    raise ValueError("A kangaroo reached the point at infinity.")
+                distance += 1 << jump
+            advanced.append((is_wild, distance))
+
+        return advanced, distinguished
+
+    def kangaroo(self, target_point, range_start, range_end):
+        """Implements Pollard's kangaroo algorithm to find the private key."""
+        # Unlike bsgs, memory does not grow with the range: only distinguished points (x coordinates
+        # with dp_bits low zero bits) are stored, and a tame/wild collision on one reveals the key
+        interval_size = range_end - range_start + 1
+        if interval_size <= 0:
+            return None, 0
+        processes = _cpu_count()
+        herd = self._KANGAROO_HERD * processes  # Tame kangaroos, and as many wild ones
+        sqrt_interval = math.isqrt(interval_size)
+
+        # Jumps 2**0..2**(jump_count-1), averaging about herd * sqrt(interval_size) / 2 (van Oorschot-Wiener)
+        mean_jump = max(1, herd * sqrt_interval // 2)
+        jump_count = 1
+        while ((1 << jump_count) - 1) // jump_count < mean_jump:
+            jump_count += 1
+        # Distinguished points about every sqrt(sqrt_interval / herd) jumps keep the trap table small
+        dp_bits = (sqrt_interval // (2 * herd)).bit_length() // 2
+        hops = self._KANGAROO_ROUND << dp_bits  # Jumps per kangaroo per round
+        max_hops = 16 * (2 * sqrt_interval + 2 * herd * (1 << dp_bits))  # Give up well past the expected cost
+
+        def new_kangaroo(is_wild):
+            # Tame kangaroos start inside the range, wild ones a random distance past the target; never at
+            # distance 0, as 0*G is the point at infinity
+            return is_wild, max(1, random.randrange(interval_size) + (1 if is_wild else range_start))
+
+        kangaroos = [new_kangaroo(False) for _ in range(herd)] + [new_kangaroo(True) for _ in range(herd)]
+        groups = [kangaroos[i::processes] for i in range(processes)]
+        traps = {}  # x coordinate -> (is_wild, distance) of the first kangaroo through that distinguished point
+        target_encoding = target_point.format()
+        hops_tried = 0
+
+        pool = multiprocessing.Pool(processes, _init_worker, (target_encoding.hex(),))
+        try:
+            while hops_tried < max_hops:
+                tasks = [(group, jump_count, dp_bits, hops) for group in groups]
+                for group_index, (advanced, distinguished) in enumerate(pool.map(_kangaroo_worker, tasks)):
+                    hops_tried += hops * len(advanced)
+                    groups[group_index] = advanced
+                    for x, index, is_wild, distance in distinguished:
+                        other = traps.setdefault(x, (is_wild, distance))
+                        if other == (is_wild, distance):
+                            continue
+                        if other[0] == is_wild:
+                            # Two kangaroos of the same kind now share a path; restart the later one
+                            groups[group_index][index] = new_kangaroo(is_wild)
+                            continue
+                        # tame*G == +-(target + wild*G), as P and -P share x
+                        tame, wild = (other[1], distance) if is_wild else (distance, other[1])
+                        for private_key in ((tame - wild) % SECP256k1.order, (-tame - wild) % SECP256k1.order):
+                            if self._is_private_key(private_key, target_encoding):
+                                return private_key, hops_tried
+        finally:
+            pool.close()
+            pool.join()
+
+        return None, hops_tried
+
+    def _parallel_bsgs(self, target_public_key, start_range, end_range):
+        """Runs bsgs over start_range..end_range on every CPU, returning (private key or None, steps tried)."""
+        interval_size = end_range - start_range + 1
+        processes = _cpu_count()
+        # Every worker builds the max_steps baby steps and takes interval_size / (processes * (2*max_steps + 1))
+        # giant steps, which balances at max_steps = sqrt(interval_size / (2 * processes)). Rounded up, so
+        # the range needs at most one window per worker, and computed with integer isqrt, as floats
+        # lose precision long before real puzzle ranges (~2**256).
+        worker_share = -(-interval_size // processes)
+        max_steps = max(1, math.isqrt(worker_share // 2))
+        if max_steps * (2 * max_steps + 1) < worker_share:
+            max_steps += 1
 
-        start_time = time.time()
         total_steps_tried = 0
-        private_key_integer = None
+        if self.cache_dir is not None:
+            # Built (or loaded) here first, so the workers find it on disk instead of each building it;
+            # without a cache_dir each worker builds its own, and a copy here would only be wasted
+            _, total_steps_tried = self._baby_steps(max_steps)
 
-        # Iterates over the range of private keys
-        for start in range(start_range, end_range, max_steps):
-            key, steps = self.bsgs(target_public_key_point, max_steps, start)
-            total_steps_tried += steps
-            if key is not None:
-                private_key_integer = key
-                break
+        # Iterates over the range of private keys, each bsgs window covering max_steps * (2*max_steps + 1) keys.
+        # The windows are split into one run of consecutive windows per worker process, the run
+        # lengths differing by at most one; once one finds the key, the event tells the others to
+        # stop, which bsgs checks after every block of giant steps.
+        window_size = max_steps * (2 * max_steps + 1)
+        window_count = max(0, -(-interval_size // window_size))
+        run_starts = [start_range + (i * window_count // processes) * window_size for i in range(processes + 1)]
+        chunks = [
+            (chunk_start, min(chunk_end, end_range + 1), max_steps)
+            for chunk_start, chunk_end in zip(run_starts, run_starts[1:])
+            if chunk_start < chunk_end
+        ]
+        found = multiprocessing.Event()
+        # Workers queue their progress lines and a single thread here prints them, so the
+        # workers never wait on the stdout lock
+        progress = multiprocessing.Queue()
+        printer = threading.Thread(target=_print_progress, args=(progress,), daemon=True)
+        printer.start()
+        pool = multiprocessing.Pool(processes, _init_worker, (target_public_key, found, progress, self.cache_dir))
+        try:
+            for key, steps in pool.imap_unordered(_bsgs_worker, chunks):
+                total_steps_tried += steps
+                if key is not None:
+                    return key, total_steps_tried
+        finally:
+            # Stopping the workers cooperatively rather than with Pool.terminate(), which can
+            # deadlock when it kills a worker that is still picking up its task
+            found.set()
+            pool.close()
+            pool.join()
+            progress.put(None)
+            printer.join()
 
-            print(f"[+] {start:x} - {min(start + max_steps, end_range):x}")
+        return None, total_steps_tried
+
+    def solve_puzzle(self, target_public_key, target_address, start_range_hex, end_range_hex, method='bsgs'):
+        """Main method to solve the puzzle and find the private key, with method 'bsgs' or 'kangaroo'."""
+        start_range = int(start_range_hex, 16)  # Converts the start range from hexadecimal to decimal
+        end_range = int(end_range_hex, 16)  # Converts the end range from hexadecimal to decimal
+
+        start_time = time.time()
+        if method == 'bsgs':
+            private_key_integer, total_steps_tried = self._parallel_bsgs(target_public_key, start_range, end_range)
+        elif method == 'kangaroo':
+            target_point = self.calculate_public_key_point(target_public_key)
+            private_key_integer, total_steps_tried = self.kangaroo(target_point, start_range, end_range)
+        else:
+            raise ValueError(f"Unknown search method: {method!r}")
 
         if private_key_integer is not None:
             private_key_hex = format(private_key_integer, '064x')  # Converts the private key to hexadecimal
@@ -143,3 +486,64 @@ class KeyFinder:
             print(f"Attempts per second: {attempts_per_second:.0f}")
         else:
             print("Execution time too short to calculate the rate.")
+
+
+def _cpu_count():
+    """Returns the number of CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))  # Honours taskset and cgroup cpusets
+    return os.cpu_count() or 1
+
+
+def _init_worker(target_public_key, found=None, progress=None, cache_dir=None):
+    """Creates the KeyFinder, target point, stop event and progress queue used by a worker process."""
+    global _worker_key_finder, _worker_target_point, _worker_found, _worker_progress
+    # Built inside each worker (libsecp256k1 buffers can't be pickled); the baby-step table is then
+    # loaded from cache_dir, or built once per worker, and reused for every window it searches
+    _worker_key_finder = KeyFinder(cache_dir)
+    _worker_target_point = _worker_key_finder.calculate_public_key_point(target_public_key)
+    _worker_found = found
+    _worker_progress = progress
+
+
+def _print_progress(progress):
+    """Prints the progress lines queued by the worker processes until it receives None."""
+    for message in iter(progress.get, None):
+        print(message)
+
+
+def _bsgs_worker(chunk):
+    """Runs bsgs over the consecutive windows of one (chunk_start, chunk_end, max_steps) chunk."""
+    chunk_start, chunk_end, max_steps = chunk
+    window_size = max_steps * (2 * max_steps + 1)
+    # Consecutive windows are window_size apart, so each window's target - start*G is the previous
+    # one's minus window_size*G: a single point addition instead of a scalar multiplication
+    neg_window_step = PublicKey.from_secret((SECP256k1.order - window_size).to_bytes(32, 'big'))
+    start_point = _worker_key_finder._offset_point(_worker_target_point, chunk_start)
+    steps_tried = 0
+
+    for start in range(chunk_start, chunk_end, window_size):
+        if _worker_found.is_set():
+            break  # Another worker already found the key
+        key, steps = _worker_key_finder.bsgs(
+            _worker_target_point, max_steps, start, start_point, stop=_worker_found.is_set)
+        steps_tried += steps
+        if key is not None:
+            _worker_found.set()
+            return key, steps_tried
+        if _worker_found.is_set():
+            break  # Stopped partway through the window
+
+        _worker_progress.put(f"[+] {start:x} - {min(start + window_size, chunk_end):x}")
+        try:
+            start_point = PublicKey.combine_keys([start_point, neg_window_step])
+        except ValueError:
+            start_point = None  # Point at infinity: bsgs recomputes it and finds the key at start
+
+    return None, steps_tried
+
+
+def _kangaroo_worker(task):
+    """Advances one group of kangaroos by a round of jumps in a worker process."""
+    kangaroos, jump_count, dp_bits, hops = task
+    return _worker_key_finder._kangaroo_hops(_worker_target_point, kangaroos, jump_count, dp_bits, hops)